@@ -1,17 +1,17 @@
-import csv
+import functools
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from subprocess import CalledProcessError
-from typing import List
+from typing import List, NamedTuple
 
 import click
-from jinja2 import Template
-from vagrant import Vagrant
 
 
 _DISTRO_CONFIG_FILE = "nixtrobed.distros"
+_BYTECODE_CACHE_DIRECTORY = ".nixtrobed_cache"
 _VAGRANTFILE_TEMPLATE_PATH = "Vagrantfile.jinja"
-_PLAYBOOK_DIRECTORY = "provisioning/playbooks"
 _DEFAULT_PLAYBOOK_NAME = "default.yml"
 
 
@@ -31,11 +31,8 @@ def initialize_testbed_directory(directory):
     \b
     DIRECTORY is the target directory. This must not exist yet."""
     directory = Path(directory)
-    _create_directory_structure(directory)
-    _write_default_config_file(directory)
-    _write_vagrantfile_template(directory)
-    _generate_ansible_config(directory)
-    _generate_default_playbook(directory)
+    directory.mkdir()
+    _extract_skeleton(directory)
     return 0
 
 
@@ -48,23 +45,7 @@ def start_distro_boxes(distros: tuple) -> int:
 
     \b
     DISTRO one or more names of distributions to start."""
-    _assert_cwd_is_nixtrobed_directory()
-    _generate_vagrantfile(_parse_distro_config())
-    vagrant = Vagrant(quiet_stdout=False, quiet_stderr=False)
-
-    if len(distros) < 1 or "all" in distros:
-        vagrant.up()
-    else:
-        for name in distros:
-            try:
-                vagrant.up(vm_name=name)
-            except CalledProcessError as err:
-                print(
-                    "An error occurred when calling Vagrant. See above for details.",
-                    file=sys.stderr,
-                )
-                return err.returncode
-    return 0
+    return _run_vagrant_action("up", distros, needs_vagrantfile=True)
 
 
 @main.command(name="stop")
@@ -76,21 +57,7 @@ def stop_distro_boxes(distros: tuple) -> int:
 
     \b
     DISTRO one or more names of distributions to start."""
-    _assert_cwd_is_nixtrobed_directory()
-    vagrant = Vagrant(quiet_stdout=False, quiet_stderr=False)
-    if len(distros) < 1 or "all" in distros:
-        vagrant.halt()
-    else:
-        for name in distros:
-            try:
-                vagrant.halt(vm_name=name)
-            except CalledProcessError as err:
-                print(
-                    "An error occurred when calling Vagrant. See above for details.",
-                    file=sys.stderr,
-                )
-                return err.returncode
-    return 0
+    return _run_vagrant_action("halt", distros, needs_vagrantfile=False)
 
 
 @main.command(name="provision")
@@ -100,139 +67,117 @@ def provision_distro_boxes(distros: tuple) -> int:
 
     \b
     DISTRO one or more names of distributions to start."""
+    return _run_vagrant_action("provision", distros, needs_vagrantfile=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_vagrant():
+    from vagrant import Vagrant
+
+    return Vagrant(quiet_stdout=False, quiet_stderr=False)
+
+
+def _run_vagrant_action(action: str, distros: tuple, needs_vagrantfile: bool) -> int:
     _assert_cwd_is_nixtrobed_directory()
-    _generate_vagrantfile(_parse_distro_config())
-    vagrant = Vagrant(quiet_stdout=False, quiet_stderr=False)
+    if needs_vagrantfile:
+        _generate_vagrantfile(_parse_distro_config())
+    method = getattr(_get_vagrant(), action)
+    targets = frozenset(distros)
 
-    if len(distros) < 1 or "all" in distros:
-        vagrant.provision()
+    if not targets or "all" in targets:
+        method()
     else:
-        for name in distros:
-            try:
-                vagrant.provision(vm_name=name)
-            except CalledProcessError as err:
-                print(
-                    "An error occurred when calling Vagrant. See above for details.",
-                    file=sys.stderr,
-                )
-                return err.returncode
+        max_workers = min(len(targets), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(method, vm_name=name): name for name in targets
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except CalledProcessError as err:
+                    sys.stderr.write(
+                        "An error occurred when calling Vagrant. See above for details.\n"
+                    )
+                    return err.returncode
     return 0
 
 
 def _assert_cwd_is_nixtrobed_directory() -> None:
+    entries = {entry.name for entry in os.scandir(".")}
     for required_file in (
         _VAGRANTFILE_TEMPLATE_PATH,
         _DISTRO_CONFIG_FILE,
         "provisioning",
     ):
-        if not (Path() / required_file).exists():
+        if required_file not in entries:
             raise RuntimeError(
                 f"{required_file} is missing. Are you in a nixtrobed directory?"
             )
 
 
-def _create_directory_structure(path: Path) -> None:
-    path.mkdir()
-    Path(path / "provisioning" / "playbooks").mkdir(parents=True)
-    Path(path / "provisioning" / "roles").mkdir()
-
-
-def _write_default_config_file(path: Path) -> None:
-    config_path = path / _DISTRO_CONFIG_FILE
-    with config_path.open("w") as config:
-        writer = csv.DictWriter(config, fieldnames=("name", "box", "playbook"))
-        config.write("#name,box,playbook\n")
-        for distro in _DEFAULT_DISTRIBUTIONS:
-            writer.writerow(distro)
-
-
-def _write_vagrantfile_template(path: Path) -> None:
-    vagrantfile = path / _VAGRANTFILE_TEMPLATE_PATH
-    with vagrantfile.open("w") as vfile:
-        vfile.write(_VAGRANTFILE_TEMPLATE)
-
+def _extract_skeleton(directory: Path) -> None:
+    import importlib.resources
+    import tarfile
 
-def _generate_ansible_config(path: Path) -> None:
-    ansible_cfg = path / "provisioning" / "ansible.cfg"
-    with ansible_cfg.open("w") as config:
-        config.write("[defaults]\n")
-        config.write("roles_path = roles")
+    skeleton = importlib.resources.files("nixtrobed") / "data" / "skeleton.tar"
+    with importlib.resources.as_file(skeleton) as skeleton_path:
+        with tarfile.open(skeleton_path) as archive:
+            archive.extractall(directory)
 
 
-def _generate_default_playbook(path: Path) -> None:
-    playbook = Path(path) / _PLAYBOOK_DIRECTORY / _DEFAULT_PLAYBOOK_NAME
-    with playbook.open("w") as pbook:
-        pbook.write("---\n\n")
-        pbook.write("- hosts: all\n")
-        pbook.write("  tasks:\n")
-        pbook.write("  roles:\n")
+class Distro(NamedTuple):
+    name: str
+    box: str
+    playbook: str
 
 
-def _parse_distro_config() -> List[dict]:
+def _parse_distro_config() -> List[Distro]:
     distro_config = Path() / _DISTRO_CONFIG_FILE
     distros = []
-    with distro_config.open("r") as config:
-        reader = csv.DictReader(config, fieldnames=("name", "box", "playbook"))
-        for record in reader:
-            if record["name"][0] == "#":
+    with distro_config.open("r", buffering=65536) as config:
+        for line_number, line in enumerate(config.read().splitlines(), start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
                 continue
-            if record["name"] is None or record["name"].strip() == "":
+            fields = line.split(",", 2)
+            fields += [""] * (3 - len(fields))
+            name, box, playbook = (field.strip() for field in fields)
+            if not name:
                 raise RuntimeError(
-                    f"Malformed line in {distro_config}. Line {reader.line_num} contains no distro name."
+                    f"Malformed line in {distro_config}. Line {line_number} contains no distro name."
                 )
-            if record["box"] is None or record["box"].strip() == "":
+            if not box:
                 raise RuntimeError(
-                    f"Malformed line in {distro_config}. Line {reader.line_num} contains no box name."
+                    f"Malformed line in {distro_config}. Line {line_number} contains no box name."
                 )
-            if record["playbook"] is None or record["playbook"].strip() == "":
-                record["playbook"] = _DEFAULT_PLAYBOOK_NAME
-            distros.append(record)
+            if not playbook:
+                playbook = _DEFAULT_PLAYBOOK_NAME
+            distros.append(Distro(name, box, playbook))
     return distros
 
 
-def _generate_vagrantfile(distros) -> None:
-    vagrantfile_tpl = Path() / _VAGRANTFILE_TEMPLATE_PATH
+@functools.lru_cache(maxsize=1)
+def _get_template_environment():
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+    return Environment(
+        loader=FileSystemLoader("."),
+        bytecode_cache=FileSystemBytecodeCache(directory=_BYTECODE_CACHE_DIRECTORY),
+        auto_reload=False,
+    )
+
+
+def _generate_vagrantfile(distros: List[Distro]) -> None:
     vagrantfile = Path() / "Vagrantfile"
-    template = Template(vagrantfile_tpl.open().read())
+    Path(_BYTECODE_CACHE_DIRECTORY).mkdir(exist_ok=True)
+    template = _get_template_environment().get_template(_VAGRANTFILE_TEMPLATE_PATH)
     template_variables = {
         "distros": distros,
         "autogenerated_warning_message": _AUTOGENERATED_WARNING_MESSAGE,
     }
     with vagrantfile.open("w") as vfile:
-        vfile.write(template.render(template_variables))
-
-
-_DEFAULT_DISTRIBUTIONS = (
-    {"name": "alma8", "box": "almalinux/8", "playbook": _DEFAULT_PLAYBOOK_NAME},
-    {"name": "fedora33", "box": "generic/fedora33", "playbook": _DEFAULT_PLAYBOOK_NAME},
-    {
-        "name": "debian11",
-        "box": "debian/bullseye64",
-        "playbook": _DEFAULT_PLAYBOOK_NAME,
-    },
-    {"name": "debian10", "box": "debian/buster64", "playbook": _DEFAULT_PLAYBOOK_NAME},
-    {"name": "ubuntu2204", "box": "ubuntu/jammy64", "playbook": _DEFAULT_PLAYBOOK_NAME},
-    {"name": "ubuntu2004", "box": "ubuntu/focal64", "playbook": _DEFAULT_PLAYBOOK_NAME},
-)
-
-
-_VAGRANTFILE_TEMPLATE = """# -*- mode: ruby -*-
-# vi: set ft=ruby :
-{{ autogenerated_warning_message }}
-
-Vagrant.configure("2") do |config|
-  {% for distro in distros %}
-  config.vm.define "{{ distro.name }}" do |{{ distro.name }}|
-    {{ distro.name }}.vm.box = "{{ distro.box }}"
-
-    {{ distro.name }}.vm.provision "ansible" do |ansible|
-      ansible.config_file = "provisioning/ansible.cfg"
-      ansible.playbook = "provisioning/playbooks/{{ distro.playbook }}"
-    end
-  end
-  {% endfor %}
-end
-"""
+        template.stream(**template_variables).dump(vfile)
 
 
 _AUTOGENERATED_WARNING_MESSAGE = """#
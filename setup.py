@@ -8,6 +8,7 @@ setup(
     author_email="martin@0x4d4c.xyz",
     url="https://github.com/0x4d4c/nixtrobed",
     packages=find_packages(),
+    package_data={"nixtrobed": ["data/skeleton.tar"]},
     install_requires=[
         "ansible",
         "click",
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Regenerate nixtrobed/data/skeleton.tar.
+
+The tar holds the initial testbed layout that "nixtrobed init" extracts.
+Edit the file contents below and re-run this script from the repository
+root whenever the skeleton changes. The archive is written
+deterministically (fixed ownership, permissions and timestamps) so
+regenerating it without content changes produces an identical file.
+"""
+
+import io
+import tarfile
+from pathlib import Path
+
+
+_DEFAULT_PLAYBOOK_NAME = "default.yml"
+
+_DEFAULT_DISTRIBUTIONS = (
+    {"name": "alma8", "box": "almalinux/8", "playbook": _DEFAULT_PLAYBOOK_NAME},
+    {"name": "fedora33", "box": "generic/fedora33", "playbook": _DEFAULT_PLAYBOOK_NAME},
+    {
+        "name": "debian11",
+        "box": "debian/bullseye64",
+        "playbook": _DEFAULT_PLAYBOOK_NAME,
+    },
+    {"name": "debian10", "box": "debian/buster64", "playbook": _DEFAULT_PLAYBOOK_NAME},
+    {"name": "ubuntu2204", "box": "ubuntu/jammy64", "playbook": _DEFAULT_PLAYBOOK_NAME},
+    {"name": "ubuntu2004", "box": "ubuntu/focal64", "playbook": _DEFAULT_PLAYBOOK_NAME},
+)
+
+_DEFAULT_CONFIG_TEXT = (
+    "#name,box,playbook\n"
+    + "\n".join(
+        f"{distro['name']},{distro['box']},{distro['playbook']}"
+        for distro in _DEFAULT_DISTRIBUTIONS
+    )
+    + "\n"
+)
+
+_ANSIBLE_CFG_TEXT = "[defaults]\nroles_path = roles\n"
+
+_DEFAULT_PLAYBOOK_TEXT = "---\n\n- hosts: all\n  tasks:\n  roles:\n"
+
+_VAGRANTFILE_TEMPLATE = """# -*- mode: ruby -*-
+# vi: set ft=ruby :
+{{ autogenerated_warning_message }}
+
+Vagrant.configure("2") do |config|
+  {% for distro in distros %}
+  config.vm.define "{{ distro.name }}" do |{{ distro.name }}|
+    {{ distro.name }}.vm.box = "{{ distro.box }}"
+
+    {{ distro.name }}.vm.provision "ansible" do |ansible|
+      ansible.config_file = "provisioning/ansible.cfg"
+      ansible.playbook = "provisioning/playbooks/{{ distro.playbook }}"
+    end
+  end
+  {% endfor %}
+end
+"""
+
+_SKELETON_DIRECTORIES = (
+    "provisioning",
+    "provisioning/playbooks",
+    "provisioning/roles",
+)
+
+_SKELETON_FILES = (
+    ("nixtrobed.distros", _DEFAULT_CONFIG_TEXT),
+    ("Vagrantfile.jinja", _VAGRANTFILE_TEMPLATE),
+    ("provisioning/ansible.cfg", _ANSIBLE_CFG_TEXT),
+    (f"provisioning/playbooks/{_DEFAULT_PLAYBOOK_NAME}", _DEFAULT_PLAYBOOK_TEXT),
+)
+
+
+def main() -> int:
+    skeleton_tar = Path("nixtrobed") / "data" / "skeleton.tar"
+    skeleton_tar.parent.mkdir(exist_ok=True)
+    with tarfile.open(skeleton_tar, "w", format=tarfile.USTAR_FORMAT) as archive:
+        for name in _SKELETON_DIRECTORIES:
+            info = tarfile.TarInfo(name)
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+            archive.addfile(info)
+        for name, text in _SKELETON_FILES:
+            data = text.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o644
+            archive.addfile(info, io.BytesIO(data))
+    print(f"wrote {skeleton_tar}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())